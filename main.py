@@ -1,14 +1,28 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from openai import OpenAI
-import pdfplumber
+from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    InternalServerError,
+    RateLimitError
+)
+import anyio
+import asyncio
+import httpx
+import pymupdf
 from reportlab.pdfgen import canvas
 import uuid
+import hashlib
 import os
 import json
+import logging
 import time
-import re
+import random
+from contextlib import asynccontextmanager
 from typing import Optional
 
 # -------------------------
@@ -16,11 +30,35 @@ from typing import Optional
 # -------------------------
 
 OUTPUT_DIR = "generated"
+MAX_PAGES = 20
+MAX_UPLOAD_BYTES = 10_000_000
+PDF_FILENAME_FMT = "optimized_resume_{}.pdf"
+PDF_PATH_FMT = os.path.join(OUTPUT_DIR, PDF_FILENAME_FMT)
+PDF_FONT = "Helvetica"
+PDF_FONT_SIZE = 12
+PDF_LEADING = 20
+OUTPUT_TTL = 3600
+CLEANUP_INTERVAL = 600
+CACHE_TTL = 86400
+CACHE_DIR = "cache"
+MODEL = "deepseek-chat"
+PROMPT_VERSION = "v2"
 MAX_RETRIES = 3
-RETRY_DELAY = 2
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 10
 TIMEOUT_SECONDS = 60
+MAX_OUTPUT_TOKENS = 2000
+BATCH_MAX = 8
+BATCH_WINDOW = 0.05
+BATCH_MAX_TOKENS = 8000
+BATCH_CONTEXT_TOKENS = 32000
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+logger = logging.getLogger(__name__)
 
 # -------------------------
 # Load API key safely
@@ -31,17 +69,117 @@ api_key = os.getenv("DEEPSEEK_API_KEY")
 if not api_key:
     raise RuntimeError("DEEPSEEK_API_KEY not set")
 
-client = OpenAI(
+client = AsyncOpenAI(
     api_key=api_key,
     base_url="https://api.deepseek.com",
-    timeout=TIMEOUT_SECONDS
+    timeout=TIMEOUT_SECONDS,
+    max_retries=0,  # retries are handled by call_ai_with_retry
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+        )
+    )
 )
 
 # -------------------------
 # FastAPI init
 # -------------------------
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+
+    global batch_queue
+
+    batch_queue = asyncio.Queue()
+
+    worker = asyncio.create_task(batch_worker())
+
+    cleanup = asyncio.create_task(cleanup_worker())
+
+    yield
+
+    worker.cancel()
+
+    cleanup.cancel()
+
+    await client.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+# -------------------------
+# UPLOAD SIZE LIMIT
+# -------------------------
+
+class UploadTooLarge(HTTPException):
+
+    def __init__(self):
+        super().__init__(413, "File too large")
+
+
+class UploadLimitMiddleware:
+
+    # Plain ASGI middleware: no per-request BaseHTTPMiddleware task/stream overhead
+
+    def __init__(self, app, max_bytes: int):
+
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+
+        # Declared oversize: reject before any of the body is read
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            return await upload_too_large_response()(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive():
+
+            nonlocal received
+
+            message = await receive()
+
+            if message["type"] == "http.request":
+
+                received += len(message.get("body", b""))
+
+                # Chunked bodies have no content-length; stop as soon as the
+                # limit is crossed instead of spooling the rest to disk
+                if received > self.max_bytes:
+                    raise UploadTooLarge()
+
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def upload_too_large_response() -> JSONResponse:
+
+    return JSONResponse({
+
+        "success": False,
+
+        "error": "File too large"
+
+    }, status_code=413)
+
+
+@app.exception_handler(UploadTooLarge)
+async def handle_upload_too_large(request: Request, exc: UploadTooLarge):
+
+    return upload_too_large_response()
+
+
+# Registered before CORS so rejections still carry CORS headers
+app.add_middleware(UploadLimitMiddleware, max_bytes=MAX_UPLOAD_BYTES)
 
 app.add_middleware(
     CORSMiddleware,
@@ -71,79 +209,96 @@ def home():
 # PDF TEXT EXTRACTION
 # -------------------------
 
-def extract_text(file) -> str:
+def open_pdf(data: bytes) -> pymupdf.Document:
+
+    try:
+
+        # Parse straight from the uploaded bytes; no file handle or spool involved
+        return pymupdf.open(stream=data, filetype="pdf")
+
+    except Exception as e:
+
+        # Unparseable upload is a client error, not a server failure
+        raise HTTPException(400, f"Invalid PDF: {str(e)}")
+
+
+def extract_text(doc: pymupdf.Document) -> str:
 
     try:
 
-        text = ""
+        parts = []
+
+        # No resume is longer than MAX_PAGES; ignore the rest
+        for page in doc.pages(0, min(doc.page_count, MAX_PAGES)):
 
-        with pdfplumber.open(file) as pdf:
+            # Pages without fonts are image-only; skip before parsing content
+            if not page.get_fonts():
+                continue
 
-            for page in pdf.pages:
+            page_text = page.get_text("text")
 
-                page_text = page.extract_text()
+            if page_text.strip():
+                parts.append(page_text)
 
-                if page_text:
-                    text += page_text + "\n"
+        text = "\n".join(parts)
 
         if not text.strip():
             raise HTTPException(400, "No readable text in PDF")
 
         return text
 
+    except HTTPException:
+
+        raise
+
     except Exception as e:
 
         raise HTTPException(500, f"PDF extraction failed: {str(e)}")
 
 
 # -------------------------
-# GUARANTEED JSON PARSER
+# AI CALL WITH RETRY + TIMEOUT
 # -------------------------
 
-def extract_json_from_text(text: str) -> Optional[dict]:
-
-    try:
-
-        # Direct parse
-        return json.loads(text)
+class EmptyResponseError(Exception):
+    pass
 
-    except:
 
-        pass
+class TruncatedResponseError(Exception):
+    pass
 
-    # Try extract JSON block
-    match = re.search(r"\{.*\}", text, re.DOTALL)
 
-    if match:
+# Transient failures only; auth/validation errors and bugs fail immediately
+RETRYABLE_ERRORS = (
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+    EmptyResponseError
+)
 
-        try:
-            return json.loads(match.group())
-        except:
-            pass
 
-    return None
+def retry_delay(attempt: int) -> float:
 
+    # Exponential backoff with jitter so concurrent retries don't stampede
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
 
-# -------------------------
-# AI CALL WITH RETRY + TIMEOUT
-# -------------------------
+    return random.uniform(RETRY_BASE_DELAY, ceiling)
 
-def call_ai_with_retry(prompt: str) -> str:
 
-    last_error = None
+async def call_ai_with_retry(prompt: str, max_tokens: int) -> str:
 
     for attempt in range(MAX_RETRIES):
 
         try:
 
-            response = client.chat.completions.create(
+            stream = await client.chat.completions.create(
 
-                model="deepseek-chat",
+                model=MODEL,
 
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a professional ATS resume optimizer."
+                        "content": "ATS resume optimizer. Output JSON only."
                     },
                     {
                         "role": "user",
@@ -152,90 +307,392 @@ def call_ai_with_retry(prompt: str) -> str:
                 ],
 
                 temperature=0.2,
-                max_tokens=2000
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True
             )
 
-            if not response:
-                raise Exception("Empty response object")
+            parts = []
+            finish_reason = None
+
+            async for chunk in stream:
+
+                if not chunk.choices:
+                    continue
 
-            content = response.choices[0].message.content
+                if chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+
+                if chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+
+            # A cut-off JSON envelope can't be parsed; let the caller raise the budget
+            if finish_reason == "length":
+                raise TruncatedResponseError(f"AI response truncated at {max_tokens} tokens")
+
+            content = "".join(parts)
 
             if not content:
-                raise Exception("Empty content")
+                raise EmptyResponseError("Empty content")
 
             return content
 
-        except Exception as e:
-
-            last_error = str(e)
+        except RETRYABLE_ERRORS as e:
 
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
+                await asyncio.sleep(retry_delay(attempt))
             else:
-                raise Exception(f"AI failed after retries: {last_error}")
+                raise Exception(f"AI failed after retries: {e}")
 
 
 # -------------------------
-# OPTIMIZER
+# RESPONSE CACHE
 # -------------------------
 
-def optimize_resume(text: str) -> str:
+def cache_key(text: str) -> str:
 
-    prompt = f"""
-You are an expert ATS resume optimizer.
+    # Re-exports that differ only in whitespace share an entry; any other
+    # change (contact details, a new bullet) is a miss
+    normalized = " ".join(text.split())
+
+    # Prompt version and model are part of the key so edits invalidate old entries
+    return hashlib.sha256(
+        f"{PROMPT_VERSION}|{MODEL}|{normalized}".encode("utf-8")
+    ).hexdigest()
+
+
+def read_cache(key: str) -> Optional[str]:
+
+    path = os.path.join(CACHE_DIR, f"{key}.txt")
+
+    try:
 
-Improve this resume professionally.
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    except FileNotFoundError:
+
+        return None
+
+
+def write_cache(key: str, content: str) -> None:
+
+    path = os.path.join(CACHE_DIR, f"{key}.txt")
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+    try:
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        # Atomic swap so concurrent readers never see a partial entry
+        os.replace(tmp_path, path)
+
+    except OSError:
+
+        # Caching is best-effort; never fail the request over it
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# -------------------------
+# AI JSON PARSER
+# -------------------------
 
-Return JSON format only:
+JSON_DECODER = json.JSONDecoder()
 
-{{
-  "optimized_text": "full optimized resume text"
-}}
+
+def parse_ai_json(text: str) -> dict:
+
+    # raw_decode from the first "{" tolerates code fences or trailing prose
+    # in one linear pass, with no backtracking regex
+    start = text.find("{")
+
+    if start == -1:
+        raise ValueError("No JSON object in AI response")
+
+    parsed, _ = JSON_DECODER.raw_decode(text, start)
+
+    return parsed
+
+
+# -------------------------
+# SINGLE + BATCHED AI PROMPTS
+# -------------------------
+
+def output_budget(text: str) -> int:
+
+    # Output length tracks input length (~3 chars per token plus JSON overhead)
+    return min(MAX_OUTPUT_TOKENS, len(text) // 3 + 400)
+
+
+async def optimize_single(text: str, max_tokens: int) -> str:
+
+    prompt = f"""
+Improve this resume professionally. Return JSON:
+
+{{"optimized_text": "full optimized resume text"}}
 
 Resume:
 {text}
 """
 
-    result = call_ai_with_retry(prompt)
+    try:
+
+        result = await call_ai_with_retry(prompt, max_tokens)
+
+    except TruncatedResponseError:
+
+        if max_tokens >= MAX_OUTPUT_TOKENS:
+            raise
+
+        # The input-based estimate fell short; retry once at the full budget
+        result = await call_ai_with_retry(prompt, MAX_OUTPUT_TOKENS)
+
+    try:
+
+        optimized_text = parse_ai_json(result)["optimized_text"]
+
+        if not isinstance(optimized_text, str):
+            raise TypeError(f"optimized_text is {type(optimized_text).__name__}")
+
+        return optimized_text
+
+    except (ValueError, TypeError, KeyError) as e:
+
+        # JSON mode should make this ~0%; log so regressions are visible
+        logger.warning("Malformed AI JSON response: %s", e)
+
+        raise Exception("AI returned malformed JSON")
+
+
+async def optimize_batch(items: list) -> list:
+
+    resumes = "\n\n".join(
+        f"Resume {i}:\n{text}" for i, (text, _) in enumerate(items, 1)
+    )
+
+    prompt = f"""
+Improve each resume professionally. Return JSON with one result per resume, where "id" is the resume's number:
+
+{{"results": [{{"id": 1, "optimized_text": "full optimized resume text"}}]}}
+
+{resumes}
+"""
+
+    max_tokens = sum(budget for _, budget in items)
+
+    try:
+
+        result = await call_ai_with_retry(prompt, max_tokens)
+
+        results = parse_ai_json(result)["results"]
+
+        # Map by echoed id, never by position, so a reordered or merged reply
+        # can't hand one user another user's resume
+        by_id = {int(item["id"]): item["optimized_text"] for item in results}
+
+        expected = set(range(1, len(items) + 1))
+
+        if len(results) != len(items) or set(by_id) != expected:
+            raise ValueError(f"expected ids {sorted(expected)}, got {sorted(by_id)}")
+
+        if not all(isinstance(text, str) for text in by_id.values()):
+            raise TypeError("optimized_text is not a string")
+
+        return [by_id[i] for i in range(1, len(items) + 1)]
+
+    except (TruncatedResponseError, APIStatusError, ValueError, TypeError, KeyError) as e:
+
+        # Covers 4xx rejections of the combined prompt too; each resume may
+        # still succeed on its own
+        logger.warning("Unusable AI batch response, retrying singly: %s", e)
+
+    # Per-item results so one failure doesn't sink the whole batch
+    return await asyncio.gather(
+        *(optimize_single(text, budget) for text, budget in items),
+        return_exceptions=True
+    )
+
+
+# -------------------------
+# REQUEST BATCHING
+# -------------------------
+
+# Concurrent requests are collected for up to BATCH_WINDOW seconds and sent
+# to the AI as one prompt; a lone request uses the single-resume prompt.
+
+batch_queue: Optional[asyncio.Queue] = None
+batch_tasks: set = set()
+
+
+def split_by_budget(batch: list) -> list:
+
+    groups = []
+    group = []
+    output_tokens = 0
+    context_tokens = 0
+
+    for item in batch:
+
+        text, budget, _ = item
+
+        # Input counts against the context window as well as the output budget
+        cost = len(text) // 3 + budget
+
+        if group and (
+            output_tokens + budget > BATCH_MAX_TOKENS
+            or context_tokens + cost > BATCH_CONTEXT_TOKENS
+        ):
+
+            groups.append(group)
+            group = []
+            output_tokens = 0
+            context_tokens = 0
+
+        group.append(item)
+        output_tokens += budget
+        context_tokens += cost
+
+    groups.append(group)
+
+    return groups
+
+
+async def run_batch(batch: list) -> None:
+
+    items = [(text, budget) for text, budget, _ in batch]
+
+    try:
+
+        if len(items) == 1:
+            results = [await optimize_single(*items[0])]
+        else:
+            results = await optimize_batch(items)
+
+    except Exception as e:
+
+        results = [e] * len(items)
+
+    for (_, _, future), result in zip(batch, results):
+
+        # The endpoint may have been cancelled by a client disconnect
+        if future.done():
+            continue
+
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+async def batch_worker() -> None:
+
+    loop = asyncio.get_running_loop()
+
+    while True:
+
+        batch = [await batch_queue.get()]
+
+        deadline = loop.time() + BATCH_WINDOW
+
+        while len(batch) < BATCH_MAX:
+
+            remaining = deadline - loop.time()
+
+            if remaining <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        for group in split_by_budget(batch):
+
+            task = asyncio.create_task(run_batch(group))
+
+            batch_tasks.add(task)
+            task.add_done_callback(batch_tasks.discard)
+
+
+async def request_optimization(text: str, max_tokens: int) -> str:
+
+    if batch_queue is None:
+        return await optimize_single(text, max_tokens)
 
-    parsed = extract_json_from_text(result)
+    future = asyncio.get_running_loop().create_future()
 
-    if parsed and "optimized_text" in parsed:
+    await batch_queue.put((text, max_tokens, future))
 
-        return parsed["optimized_text"]
+    return await future
 
-    # fallback if AI fails format
-    return result
+
+# -------------------------
+# OPTIMIZER
+# -------------------------
+
+async def optimize_resume(text: str, max_tokens: Optional[int] = None) -> str:
+
+    key = cache_key(text)
+
+    cached = await anyio.to_thread.run_sync(read_cache, key)
+
+    if cached is not None:
+
+        return cached
+
+    if max_tokens is None:
+        max_tokens = output_budget(text)
+
+    optimized_text = await request_optimization(text, max_tokens)
+
+    await anyio.to_thread.run_sync(write_cache, key, optimized_text)
+
+    return optimized_text
 
 
 # -------------------------
 # SAFE PDF GENERATION
 # -------------------------
 
+def new_text_object(c: canvas.Canvas):
+
+    text = c.beginText(50, 800)
+
+    text.setFont(PDF_FONT, PDF_FONT_SIZE, leading=PDF_LEADING)
+
+    return text
+
+
 def create_pdf(content: str) -> str:
 
     try:
 
-        filename = f"optimized_resume_{uuid.uuid4().hex}.pdf"
+        file_id = uuid.uuid4().hex
+
+        filename = PDF_FILENAME_FMT.format(file_id)
 
-        path = os.path.join(OUTPUT_DIR, filename)
+        path = PDF_PATH_FMT.format(file_id)
 
         c = canvas.Canvas(path)
 
-        y = 800
+        # One BT/ET text block per page instead of a drawString per line
+        text = new_text_object(c)
 
         for line in content.split("\n"):
 
-            safe_line = line[:100]  # prevent overflow
+            # Break only when another line is coming, so no trailing blank page
+            if text.getY() < 50:
 
-            c.drawString(50, y, safe_line)
-
-            y -= 20
+                c.drawText(text)
+                c.showPage()
+                text = new_text_object(c)
 
-            if y < 50:
+            text.textLine(line[:100])  # prevent overflow
 
-                c.showPage()
-                y = 800
+        c.drawText(text)
 
         c.save()
 
@@ -246,22 +703,90 @@ def create_pdf(content: str) -> str:
         raise HTTPException(500, f"PDF creation failed: {str(e)}")
 
 
+# -------------------------
+# EXPIRED FILE CLEANUP
+# -------------------------
+
+# Generated PDFs and cached resumes both hold personal data; neither is kept forever
+EXPIRING_DIRS = (
+    (OUTPUT_DIR, OUTPUT_TTL),
+    (CACHE_DIR, CACHE_TTL)
+)
+
+
+def remove_expired_files(directory: str, ttl: int) -> None:
+
+    cutoff = time.time() - ttl
+
+    with os.scandir(directory) as entries:
+
+        for entry in entries:
+
+            try:
+
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+
+            except OSError:
+
+                # Already removed (e.g. by another worker process)
+                pass
+
+
+async def cleanup_worker() -> None:
+
+    while True:
+
+        for directory, ttl in EXPIRING_DIRS:
+
+            try:
+                await anyio.to_thread.run_sync(remove_expired_files, directory, ttl)
+            except OSError as e:
+                logger.warning("Cleanup of %s failed: %s", directory, e)
+
+        await asyncio.sleep(CLEANUP_INTERVAL)
+
+
+# -------------------------
+# RESPONSE MODEL
+# -------------------------
+
+# With a response_model FastAPI serializes straight to JSON bytes in
+# pydantic-core, skipping the stdlib json encoder used by JSONResponse.
+
+class OptimizeResponse(BaseModel):
+
+    success: bool
+    optimized_text: str
+    download_url: str
+
+
 # -------------------------
 # MAIN ENDPOINT
 # -------------------------
 
-@app.post("/optimize")
+@app.post("/optimize", response_model=OptimizeResponse)
 async def optimize(file: UploadFile = File(...)):
 
     try:
 
-        text = extract_text(file.file)
+        # UploadFile.read() moves disk-spooled reads off the event loop
+        data = await file.read()
 
-        optimized_text = optimize_resume(text)
+        doc = await anyio.to_thread.run_sync(open_pdf, data)
 
-        filename = create_pdf(optimized_text)
+        with doc:
 
-        return JSONResponse({
+            if doc.page_count > MAX_PAGES:
+                raise HTTPException(413, "Too many pages")
+
+            text = await anyio.to_thread.run_sync(extract_text, doc)
+
+        optimized_text = await optimize_resume(text)
+
+        filename = await anyio.to_thread.run_sync(create_pdf, optimized_text)
+
+        return {
 
             "success": True,
 
@@ -269,7 +794,17 @@ async def optimize(file: UploadFile = File(...)):
 
             "download_url": f"/download/{filename}"
 
-        })
+        }
+
+    except HTTPException as e:
+
+        return JSONResponse({
+
+            "success": False,
+
+            "error": e.detail
+
+        }, status_code=e.status_code)
 
     except Exception as e:
 
@@ -286,7 +821,7 @@ async def optimize(file: UploadFile = File(...)):
 # STRUCTURED ENDPOINT
 # -------------------------
 
-@app.post("/optimize/structured")
+@app.post("/optimize/structured", response_model=OptimizeResponse)
 async def optimize_structured(
 
     name: str = Form(...),
@@ -318,11 +853,13 @@ Education:
 {education}
 """
 
-        optimized_text = optimize_resume(structured_text)
+        # Terse form fields expand into a full resume, so output length
+        # doesn't follow input length here; use the full budget
+        optimized_text = await optimize_resume(structured_text, MAX_OUTPUT_TOKENS)
 
-        filename = create_pdf(optimized_text)
+        filename = await anyio.to_thread.run_sync(create_pdf, optimized_text)
 
-        return JSONResponse({
+        return {
 
             "success": True,
 
@@ -330,7 +867,7 @@ Education:
 
             "download_url": f"/download/{filename}"
 
-        })
+        }
 
     except Exception as e:
 
@@ -347,19 +884,22 @@ Education:
 # DOWNLOAD
 # -------------------------
 
-@app.get("/download/{filename}")
-def download(filename: str):
+# StaticFiles streams from disk without a hand-written route. The frontend is
+# cross-origin, where browsers ignore <a download>, so the attachment header is
+# added here; an Nginx alias in front of /download must set it too
+# (add_header Content-Disposition "attachment").
 
-    path = os.path.join(OUTPUT_DIR, filename)
+class DownloadFiles(StaticFiles):
 
-    if not os.path.exists(path):
+    def file_response(self, full_path, stat_result, scope, status_code=200):
 
-        raise HTTPException(404, "File not found")
+        response = super().file_response(full_path, stat_result, scope, status_code)
 
-    return FileResponse(
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="{os.path.basename(full_path)}"'
+        )
 
-        path,
-        media_type="application/pdf",
-        filename=filename
+        return response
 
-    )
+
+app.mount("/download", DownloadFiles(directory=OUTPUT_DIR), name="download")